@@ -0,0 +1,346 @@
+"""
+Low-overhead capture and replay of the requests served by the runner.
+
+Every wrapped solution call is timed and handed to a background writer thread
+as a plain tuple; encoding and disk I/O never happen on the request thread.
+The log is a rotating file of compact JSON lines, one per request:
+
+    {"ts":...,"method":"sum","args":[1,2],"result":3,"error":null,
+     "latency_ns":...}
+
+(wrapped here for readability).
+
+Values that would be expensive to keep around or encode are replaced before
+queueing: ranges by `[start, stop, step]` and long sequences by `[length,
+head]`. Such lines get an extra `"kinds"` field, e.g.,
+
+    {...,"args":[[50000000,[1,2,...]]],...,
+     "kinds":{"args":["summary"],"result":null}}
+
+which tells the reader how to restore them, so the payloads themselves are
+never interpreted.
+"""
+
+import atexit
+import functools
+import json
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, NamedTuple
+
+
+# Number of leading items kept when a long sequence is summarised.
+_HEAD_ITEMS = 16
+# Sentinel telling the writer thread to finish.
+_STOP = object()
+
+
+class RecordedRequest(NamedTuple):
+    """
+    A single request read back from the log.
+    """
+    ts: float
+    method: str
+    args: list[Any]
+    result: Any
+    error: str | None
+    latency_ns: int
+
+
+class SequenceSummary(NamedTuple):
+    """
+    Stand-in for a sequence too long to be recorded in full.
+    """
+    length: int
+    head: Any
+
+
+def _prepare(value: Any, max_items: int) -> tuple[Any, str | None]:
+    """
+    Return `value` as it should be queued, and its kind (`None` if as-is).
+
+    This runs on the request thread, so it must stay O(1).
+    """
+    if isinstance(value, range):
+        return [value.start, value.stop, value.step], "range"
+    if isinstance(value, (list, tuple, str)) and len(value) > max_items:
+        head = value[:_HEAD_ITEMS]
+        if not isinstance(head, str):
+            head = list(head)
+        return [len(value), head], "summary"
+    return value, None
+
+
+def _restore(value: Any, kind: str | None) -> Any:
+    """
+    Reverse `_prepare` for a decoded `value` of the given `kind`.
+    """
+    if kind == "range":
+        return range(*value)
+    if kind == "summary":
+        return SequenceSummary(*value)
+    return value
+
+
+class RequestRecorder:
+    """
+    Record solution calls to an append-only, rotating log.
+
+    Records are pushed to a bounded queue without blocking; if the writer
+    falls behind and the queue is full, the record is dropped and counted in
+    `dropped` rather than slowing down the request (as are calls made after
+    `close`). Records that cannot be encoded or written are counted in
+    `failed`, and the writer carries on.
+
+    :param path: Path of the log file. Rotated files get suffixes `.1`, `.2`,
+        ..., with higher numbers being older.
+    :param max_bytes: Rotate the log once it grows beyond this size (0 means
+        never rotate).
+    :param backup_count: Number of rotated files to keep.
+    :param max_pending: Maximum number of records waiting to be written.
+    :param max_items: Lists, tuples and strings longer than this are recorded
+        as a `SequenceSummary`, so that pending records stay small and cheap
+        to encode.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        backup_count: int = 5,
+        max_pending: int = 100_000,
+        max_items: int = 1000,
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.max_items = max_items
+        self.dropped = 0
+        self.failed = 0
+        self._closed = False
+        self._queue: queue.Queue = queue.Queue(max_pending)
+        self._file = open(path, "ab")
+        self._writer = threading.Thread(
+            target=self._write_loop, name="request-recorder", daemon=True,
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
+    def wrap(self, method: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Return `func` wrapped so that each of its calls is recorded.
+        """
+        @functools.wraps(func)
+        def wrapper(*args: Any) -> Any:
+            ts = time.time()
+            start = time.perf_counter_ns()
+            try:
+                result = func(*args)
+            except Exception as e:
+                self._put(
+                    ts, method, args, None, repr(e),
+                    time.perf_counter_ns() - start,
+                )
+                raise
+            self._put(
+                ts, method, args, result, None, time.perf_counter_ns() - start,
+            )
+            return result
+
+        return wrapper
+
+    def _put(
+        self,
+        ts: float,
+        method: str,
+        args: tuple,
+        result: Any,
+        error: str | None,
+        latency_ns: int,
+    ) -> None:
+        if self._closed:
+            # Nothing would ever write it.
+            self.dropped += 1
+            return
+        prepared_args = [_prepare(arg, self.max_items) for arg in args]
+        result, result_kind = _prepare(result, self.max_items)
+        record = (
+            ts, method,
+            [arg for arg, _ in prepared_args],
+            [kind for _, kind in prepared_args],
+            result, result_kind, error, latency_ns,
+        )
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        """
+        Write all pending records and stop the writer thread.
+        """
+        atexit.unregister(self.close)
+        self._closed = True
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        self._file.close()
+
+    def _write_loop(self) -> None:
+        while True:
+            # Block for the first record, then drain whatever else is waiting
+            # so that a burst of requests costs a single write and flush.
+            records = [self._queue.get()]
+            while True:
+                try:
+                    records.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            lines = []
+            for record in records:
+                if record is _STOP:
+                    stop = True
+                    continue
+                try:
+                    lines.append(self._encode(record))
+                except Exception:
+                    # E.g., circular references or ints too big to convert.
+                    # Whatever it is, it must not kill the writer.
+                    self.failed += 1
+            if lines:
+                try:
+                    self._write(("\n".join(lines) + "\n").encode())
+                except OSError:
+                    self.failed += len(lines)
+            if stop:
+                return
+
+    @staticmethod
+    def _encode(record: tuple) -> str:
+        """
+        Return the log line (without a newline) for the queued `record`.
+        """
+        (
+            ts, method, args, args_kinds, result, result_kind, error,
+            latency_ns,
+        ) = record
+        data = {
+            "ts": ts,
+            "method": method,
+            "args": args,
+            "result": result,
+            "error": error,
+            "latency_ns": latency_ns,
+        }
+        if result_kind or any(args_kinds):
+            data["kinds"] = {"args": args_kinds, "result": result_kind}
+        return json.dumps(data, separators=(",", ":"), default=repr)
+
+    def _write(self, data: bytes) -> None:
+        """
+        Append `data` to the log, rotating it if it has grown too big.
+        """
+        if self._file.closed:
+            # A previous rotation failed half-way through.
+            self._file = open(self.path, "ab")
+        self._file.write(data)
+        self._file.flush()
+        if self.max_bytes and self._file.tell() >= self.max_bytes:
+            try:
+                self._rotate()
+            except OSError:
+                # The data is written; rotation is retried after next write.
+                pass
+
+    def _rotate(self) -> None:
+        """
+        Shift rotated files by one and start a fresh log.
+        """
+        self._file.close()
+        if self.backup_count:
+            for idx in range(self.backup_count - 1, 0, -1):
+                src = f"{self.path}.{idx}"
+                if os.path.exists(src):
+                    os.replace(src, f"{self.path}.{idx + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "ab")
+
+
+def get_log_files(path: str) -> list[str]:
+    """
+    Return the existing log files for `path`, from the oldest to the newest.
+    """
+    result = []
+    idx = 1
+    while os.path.exists(f"{path}.{idx}"):
+        result.append(f"{path}.{idx}")
+        idx += 1
+    result.reverse()
+    if os.path.exists(path):
+        result.append(path)
+    return result
+
+
+def read_requests(path: str) -> Iterator[RecordedRequest]:
+    """
+    Stream the recorded requests for `path`, including rotated files.
+
+    Only one line is held in memory at a time. Lines that are not valid
+    records (e.g., a truncated last line left by a crash mid-write) are
+    skipped.
+    """
+    for file_path in get_log_files(path):
+        with open(file_path, "rb") as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                    kinds = data.pop("kinds", None)
+                    if kinds:
+                        data["args"] = [
+                            _restore(arg, kind)
+                            for arg, kind in zip(data["args"], kinds["args"])
+                        ]
+                        data["result"] = _restore(
+                            data["result"], kinds["result"],
+                        )
+                    request = RecordedRequest(**data)
+                except (ValueError, TypeError, KeyError, AttributeError):
+                    continue
+                yield request
+
+
+def replay(
+    requests: Iterable[RecordedRequest],
+    solutions: dict[str, Callable[..., Any]],
+) -> Iterator[tuple[RecordedRequest, Any, str | None, int]]:
+    """
+    Re-run recorded requests against `solutions` (method -> function).
+
+    Requests for unknown methods are skipped, as are those with summarised
+    arguments (they cannot be reconstructed).
+
+    :return: An iterator of quadruplets (recorded request, new result, new
+        error or `None`, new latency in nanoseconds), mirroring the recorded
+        fields so that the two can be compared directly.
+    """
+    for request in requests:
+        try:
+            func = solutions[request.method]
+        except KeyError:
+            continue
+        if any(isinstance(arg, SequenceSummary) for arg in request.args):
+            continue
+        result = error = None
+        start = time.perf_counter_ns()
+        try:
+            result = func(*request.args)
+        except Exception as e:
+            error = repr(e)
+        yield request, result, error, time.perf_counter_ns() - start
@@ -1,6 +1,7 @@
 from tdl.runner.challenge_session_config import ChallengeSessionConfig
 from tdl.queue.implementation_runner_config import ImplementationRunnerConfig
 from .credentials_config_file import read_from_config_file, read_from_config_file_with_default
+from .request_recorder import RequestRecorder
 
 import os
 
@@ -22,3 +23,17 @@ class Utils:
             .set_request_queue_name(read_from_config_file('tdl_request_queue_name'))\
             .set_response_queue_name(read_from_config_file('tdl_response_queue_name'))\
             .set_hostname(read_from_config_file('tdl_hostname'))
+
+    @staticmethod
+    def get_request_recorder():
+        log_path = read_from_config_file_with_default('tdl_request_log', '')
+        # The properties loader turns "true"/"false" into booleans.
+        if log_path is False or log_path == '':
+            return None
+        if not isinstance(log_path, str):
+            raise ValueError('tdl_request_log must be a file path, got: {}'.format(log_path))
+        root_dir = os.path.join(os.path.dirname(__file__), "..", "..")
+        return RequestRecorder(
+            os.path.join(root_dir, log_path),
+            max_bytes=int(read_from_config_file_with_default('tdl_request_log_max_bytes', 64 * 1024 * 1024)),
+            backup_count=int(read_from_config_file_with_default('tdl_request_log_backup_count', 5)))
@@ -22,7 +22,11 @@ from runner.user_input_action import get_user_input
        PYTHONPATH=lib python lib/send_command_to_server.py
  
     To run your unit tests locally:
-       PYTHONPATH=lib python -m pytest -q test/solution_tests/
+       PYTHONPATH=lib python -m pytest -q test/
+
+    To record the served requests for offline replay:
+       Set "tdl_request_log" in config/credentials.config to the log path.
+       Read it back with runner.request_recorder.read_requests.
  
   ~~~~~~~~~~ The workflow ~~~~~~~~~~~~~
  
@@ -55,15 +59,22 @@ from runner.user_input_action import get_user_input
  
 """
 
+recorder = Utils.get_request_recorder()
+
+
+def record(method, func):
+    return recorder.wrap(method, func) if recorder else func
+
+
 runner = QueueBasedImplementationRunnerBuilder()\
     .set_config(Utils.get_runner_config())\
-    .with_solution_for('sum', sum_solution.compute)\
-    .with_solution_for('hello', hello_solution.hello)\
-    .with_solution_for('array_sum', array_sum.compute)\
-    .with_solution_for('int_range', int_range.generate)\
-    .with_solution_for('fizz_buzz', fizz_buzz_solution.fizz_buzz)\
-    .with_solution_for('checkout', checkout_solution.checkout)\
-    .with_solution_for('checklite', checklite_solution.checklite)\
+    .with_solution_for('sum', record('sum', sum_solution.compute))\
+    .with_solution_for('hello', record('hello', hello_solution.hello))\
+    .with_solution_for('array_sum', record('array_sum', array_sum.compute))\
+    .with_solution_for('int_range', record('int_range', int_range.generate_list))\
+    .with_solution_for('fizz_buzz', record('fizz_buzz', fizz_buzz_solution.fizz_buzz))\
+    .with_solution_for('checkout', record('checkout', checkout_solution.checkout))\
+    .with_solution_for('checklite', record('checklite', checklite_solution.checklite))\
     .create()
 
 ChallengeSession\
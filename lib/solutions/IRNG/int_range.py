@@ -1,3 +1,28 @@
+"""
+Solution for the `IRNG` challenge.
+"""
+
+
 # noinspection PyUnusedLocal
-def generate(start, end):
-    raise NotImplementedError()
+def generate(start: int, end: int) -> range:
+    """
+    Return integers from `start` (inclusive) to `end` (exclusive).
+
+    Callers ask for very large ranges, so the items are not materialised:
+    length, indexing, slicing and membership of a `range` are all O(1).
+
+    :param start: The first integer in the range.
+    :param end: The integer after the last one in the range.
+    :return: A lazy, sliceable sequence of the requested integers.
+    """
+    return range(start, end)
+
+
+def generate_list(start: int, end: int) -> list[int]:
+    """
+    Return the same integers as `generate`, but as a list.
+
+    The tdl client encodes responses with a plain `json.dumps`, which only
+    handles built-in containers, so this is what the runner registers.
+    """
+    return list(range(start, end))
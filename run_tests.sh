@@ -5,7 +5,7 @@ set -euo pipefail
 if [ $# -ge 1 ]; then
     dir="$1"
 else
-    dir=test/solution_tests/
+    dir=test/
 fi
 
 PYTHONPATH=lib python -m pytest -q "$dir"
@@ -0,0 +1,169 @@
+import time
+
+import pytest
+
+from runner.request_recorder import (
+    RequestRecorder, SequenceSummary, get_log_files, read_requests, replay,
+)
+
+
+def add(x, y):
+    return x + y
+
+
+def fail(x):
+    raise ValueError(x)
+
+
+class TestRequestRecorder():
+    def test_record_and_read(self, tmp_path):
+        path = str(tmp_path / "requests.log")
+        recorder = RequestRecorder(path)
+        recorded_add = recorder.wrap("add", add)
+        recorded_fail = recorder.wrap("fail", fail)
+
+        assert recorded_add(17, 19) == 36
+        with pytest.raises(ValueError):
+            recorded_fail("oops")
+        recorder.close()
+
+        requests = list(read_requests(path))
+        assert [
+            (request.method, request.args, request.result, request.error)
+            for request in requests
+        ] == [
+            ("add", [17, 19], 36, None),
+            ("fail", ["oops"], None, "ValueError('oops')"),
+        ]
+        assert all(request.latency_ns >= 0 for request in requests)
+
+    def test_record_unencodable(self, tmp_path):
+        path = str(tmp_path / "requests.log")
+        recorder = RequestRecorder(path)
+        recorded_add = recorder.wrap("add", add)
+        circular = []
+        circular.append(circular)
+
+        recorded_add(10**5000, 1)
+        recorder.wrap("len", len)(circular)
+        # The writer survives and keeps recording.
+        recorded_add(17, 19)
+        recorder.close()
+
+        assert recorder.failed == 2
+        assert recorder.dropped == 0
+        assert [request.result for request in read_requests(path)] == [36]
+
+    def test_record_write_error(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "requests.log")
+        recorder = RequestRecorder(path)
+
+        def failing_write(data):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(recorder._file, "write", failing_write)
+        recorded_add = recorder.wrap("add", add)
+        recorded_add(1, 2)
+        # Wait for the writer to hit the error, then let the disk "recover".
+        deadline = time.monotonic() + 5
+        while not recorder.failed and time.monotonic() < deadline:
+            time.sleep(0.001)
+        monkeypatch.undo()
+        recorded_add(17, 19)
+        recorder.close()
+
+        assert recorder.failed == 1
+        assert [request.result for request in read_requests(path)] == [36]
+
+    def test_record_after_close(self, tmp_path):
+        path = str(tmp_path / "requests.log")
+        recorder = RequestRecorder(path)
+        recorded_add = recorder.wrap("add", add)
+        recorder.close()
+
+        assert recorded_add(1, 2) == 3
+        assert recorder.dropped == 1
+        assert list(read_requests(path)) == []
+
+    def test_record_range(self, tmp_path):
+        path = str(tmp_path / "requests.log")
+        recorder = RequestRecorder(path)
+        recorder.wrap("range", range)(0, 10**12)
+        recorder.close()
+
+        (request,) = read_requests(path)
+        assert request.result == range(0, 10**12)
+
+    def test_record_long_sequences(self, tmp_path):
+        path = str(tmp_path / "requests.log")
+        recorder = RequestRecorder(path, max_items=3)
+        recorder.wrap("list", list)(range(5))
+        recorder.wrap("sum", sum)([1, 2, 3])
+        recorder.wrap("upper", str.upper)("abcd")
+        recorder.close()
+
+        assert [
+            (request.args, request.result) for request in read_requests(path)
+        ] == [
+            ([range(5)], SequenceSummary(5, [0, 1, 2, 3, 4])),
+            ([[1, 2, 3]], 6),
+            ([SequenceSummary(4, "abcd")], SequenceSummary(4, "ABCD")),
+        ]
+
+    def test_record_marker_like_payloads(self, tmp_path):
+        path = str(tmp_path / "requests.log")
+        recorder = RequestRecorder(path)
+        payload = {"__range__": [0, 3, 1]}
+        recorder.wrap("dict", dict)(payload)
+        recorder.close()
+
+        (request,) = read_requests(path)
+        assert request.args == [payload]
+        assert request.result == payload
+
+    def test_rotation(self, tmp_path):
+        path = str(tmp_path / "requests.log")
+        for idx in range(4):
+            # Each recorder writes (and thus rotates) exactly once.
+            recorder = RequestRecorder(path, max_bytes=1, backup_count=2)
+            recorder.wrap("add", add)(idx, 1)
+            recorder.close()
+
+        assert get_log_files(path) == [f"{path}.2", f"{path}.1", path]
+        assert [request.result for request in read_requests(path)] == [3, 4]
+
+    def test_read_skips_truncated_line(self, tmp_path):
+        path = tmp_path / "requests.log"
+        path.write_text(
+            '{"ts":1.0,"method":"add","args":[1,2],"result":3,'
+            '"error":null,"latency_ns":5}\n{"ts":2.0,"meth'
+        )
+        assert len(list(read_requests(str(path)))) == 1
+
+    def test_read_skips_malformed_records(self, tmp_path):
+        path = tmp_path / "requests.log"
+        path.write_text(
+            '{"ts":1}\n'
+            '17\n'
+            '{"ts":1.0,"method":"add","args":[1,2],"result":3,'
+            '"error":null,"latency_ns":5,"kinds":{"result":"range"}}\n'
+            '{"ts":2.0,"method":"add","args":[1,2],"result":3,'
+            '"error":null,"latency_ns":5}\n'
+        )
+        assert [request.ts for request in read_requests(str(path))] == [2.0]
+
+    def test_replay(self, tmp_path):
+        path = str(tmp_path / "requests.log")
+        recorder = RequestRecorder(path)
+        recorder.wrap("add", add)(1, 2)
+        recorder.wrap("unknown", add)(3, 4)
+        recorder.close()
+        summarised = RequestRecorder(path, max_items=1)
+        summarised.wrap("add", add)([1, 2], [3])
+        summarised.close()
+
+        replayed = list(replay(read_requests(path), {"add": lambda x, y: x * y}))
+        assert len(replayed) == 1
+        request, result, error, latency_ns = replayed[0]
+        assert (request.result, result, error) == (3, 2, None)
+        assert latency_ns >= 0
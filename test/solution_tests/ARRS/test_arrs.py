@@ -0,0 +1,86 @@
+import array
+
+import pytest
+
+from solutions.ARRS import array_sum
+from solutions.IRNG import int_range
+
+
+class TestArraySum():
+    def test_compute(self):
+        assert array_sum.compute([1, 2, 3]) == 6
+
+    def test_compute_empty(self):
+        assert array_sum.compute([]) == 0
+
+    def test_compute_big_ints(self):
+        assert array_sum.compute([2**100, -1, 2**70]) == 2**100 + 2**70 - 1
+
+    def test_compute_range(self):
+        assert array_sum.compute(range(10**12)) == (10**12 - 1) * 10**12 // 2
+        assert array_sum.compute(range(10, 0, -3)) == 10 + 7 + 4 + 1
+        assert array_sum.compute(int_range.generate(-3, 6)) == 9
+        assert array_sum.compute(int_range.generate(6, -3)) == 0
+
+    @pytest.mark.parametrize("typecode", ["b", "B", "h", "i", "l", "q", "Q"])
+    def test_compute_buffer(self, typecode):
+        items = array.array(typecode, range(100))
+        assert array_sum.compute(items) == sum(range(100))
+
+    def test_compute_buffer_multidimensional(self):
+        items = memoryview(array.array("q", range(10))).cast("B").cast(
+            "q", (2, 5),
+        )
+        assert array_sum.compute(items) == sum(range(10))
+
+    def test_compute_buffer_no_overflow(self, monkeypatch):
+        monkeypatch.setattr(array_sum, "CHUNK_SIZE", 3)
+        values = [2**63 - 1] * 7 + [-2**63] * 2 + [-5]
+        assert array_sum.compute(array.array("q", values)) == sum(values)
+        values = [2**64 - 1] * 10
+        assert array_sum.compute(array.array("Q", values)) == sum(values)
+
+
+class TestArraySumNumPy():
+    """
+    Tests of the chunked NumPy reductions (skipped if NumPy is missing).
+    """
+
+    @classmethod
+    def setup_class(cls):
+        cls.np = pytest.importorskip("numpy")
+
+    def test_compute_uses_numpy(self):
+        assert array_sum.np is self.np
+
+    @pytest.mark.parametrize(
+        "dtype", ["int8", "uint8", "int16", "int32", "uint32", "int64"],
+    )
+    def test_compute_ndarray(self, dtype, monkeypatch):
+        monkeypatch.setattr(array_sum, "CHUNK_SIZE", 7)
+        items = self.np.arange(100, dtype=dtype)
+        assert array_sum.compute(items) == sum(range(100))
+
+    def test_compute_ndarray_multidimensional(self):
+        items = self.np.arange(12, dtype="int64").reshape(3, 4)
+        assert array_sum.compute(items) == sum(range(12))
+        assert array_sum.compute(items.T[::2]) == sum(
+            x for x in range(12) if x % 4 in (0, 2)
+        )
+
+    def test_compute_ndarray_strided(self, monkeypatch):
+        monkeypatch.setattr(array_sum, "CHUNK_SIZE", 7)
+        items = self.np.arange(1000, dtype="int32")[::3]
+        assert array_sum.compute(items) == sum(range(0, 1000, 3))
+
+    def test_compute_ndarray_no_overflow(self, monkeypatch):
+        monkeypatch.setattr(array_sum, "CHUNK_SIZE", 3)
+        values = [2**63 - 1] * 7 + [-2**63] * 2 + [-5]
+        items = self.np.array(values, dtype="int64")
+        assert array_sum.compute(items) == sum(values)
+        values = [2**64 - 1] * 10
+        items = self.np.array(values, dtype="uint64")
+        assert array_sum.compute(items) == sum(values)
+        values = [2**31 - 1] * 10
+        items = self.np.array(values, dtype="int32")
+        assert array_sum.compute(items) == sum(values)
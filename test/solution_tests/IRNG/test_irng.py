@@ -0,0 +1,33 @@
+import json
+from collections import OrderedDict
+
+from solutions.IRNG import int_range
+
+
+class TestIntRange():
+    def test_generate(self):
+        assert list(int_range.generate(3, 8)) == [3, 4, 5, 6, 7]
+
+    def test_generate_empty(self):
+        assert list(int_range.generate(8, 3)) == []
+
+    def test_generate_huge(self):
+        # Would need gigabytes if materialised.
+        result = int_range.generate(-10**12, 10**12)
+        assert len(result) == 2 * 10**12
+        assert result[0] == -10**12
+        assert result[-1] == 10**12 - 1
+        assert 17 in result
+
+    def test_slicing(self):
+        result = int_range.generate(0, 10**12)[10:20:3]
+        assert result == range(10, 20, 3)
+
+    def test_generate_list_is_json_serialisable(self):
+        # The same call the tdl client's broker uses to publish responses.
+        response = OrderedDict(
+            result=int_range.generate_list(-2, 3), error=None, id="IRNG_R1_1",
+        )
+        assert json.dumps(response, separators=(",", ":")) == (
+            '{"result":[-2,-1,0,1,2],"error":null,"id":"IRNG_R1_1"}'
+        )